@@ -166,8 +166,8 @@ class RendererLayout:
         :return arr[wave][channel] = Region
         """
 
-        wave_spaces = self.wave_nrow * self.wave_ncol
-        inds = np.arange(wave_spaces)
+        # Only compute locations of occupied wave slots.
+        inds = np.arange(self.nwaves)
 
         # Compute location of each wave.
         if self.orientation == V:
@@ -180,14 +180,16 @@ class RendererLayout:
         # Generate plot for each wave.chan. Leave unused slots empty.
         region_wave_chan: List[List[Region]] = []
 
+        # Wave dim (within screen)
+        waves_per_screen = arr(self.wave_nrow, self.wave_ncol)
+
         # The order of (rows, cols) has no effect.
         for stereo_nchan, wave_row, wave_col in zip(self.wave_nchans, rows, cols):
             # Wave = within Screen.
             # Chan = within Wave, generate a plot.
             # All arrays are [y, x] == [row, col].
 
-            # Wave dim/pos (within screen)
-            waves_per_screen = arr(self.wave_nrow, self.wave_ncol)
+            # Wave pos (within screen)
             wave_screen_pos = arr(wave_row, wave_col)
             del wave_row, wave_col
 
@@ -709,6 +709,10 @@ class AbstractMatplotlibRenderer(_RendererBackend, ABC):
     def get_frame(self) -> ByteBuffer:
         """Returns bytes with shape (h, w, self.bytes_per_pixel).
         The actual return value's shape may be flat.
+
+        The return value may be a zero-copy view of the canvas,
+        which is overwritten by the next call to get_frame().
+        Write it to outputs (or copy it) before rendering another frame.
         """
         self._redraw_over_background()
 